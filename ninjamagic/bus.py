@@ -1,4 +1,5 @@
 import asyncio
+import builtins
 import logging
 from collections import defaultdict
 from collections.abc import Callable, Iterator
@@ -432,7 +433,7 @@ def is_empty[T: Signal](cls: type[T]) -> bool:
 
 def iter[T: Signal](cls: type[T]) -> Iterator[T]:
     "Get signals of type T."
-    yield from cast(list[T], qs[cls])
+    return builtins.iter(cast(list[T], qs[cls]))
 
 
 def pulse(*sigs: Signal) -> None:
@@ -61,7 +61,7 @@ class AABB:
 ActId = NewType("ActId", int)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Armor:
     skill_key: str
     physical_immunity: float  # 0..1 (cap on how much it could block vs physical)
@@ -128,6 +128,7 @@ class Container:
     """Whether this entity can contain other entities. For example, bags or pots."""
 
 
+@component(slots=True, frozen=True)
 class DoubleDamage:
     """A tag on an entity that causes its next attack to deal double damage.
 
@@ -166,7 +167,7 @@ class Anchor:
     rankup_echo: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SpawnSlot:
     """A spawn point within a den."""
 
@@ -287,8 +288,11 @@ class ItemKey:
     key: str
 
 
+@component(slots=True, frozen=True)
 class DoNotSave:
     """Item should not be persisted to database."""
+
+
 ContainedBy = NewType("ContainedBy", EntityId)
 
 
@@ -314,6 +318,7 @@ class Hostility:
         return self.coords.get((y, x), self.default)
 
 
+@component(slots=True, frozen=True)
 class Rotting:
     """The entity has started to rot. Used by food, unless you're giving Malenia."""
 
@@ -458,10 +463,7 @@ class Skills:
     survival: Skill = field(default_factory=lambda: Skill(name="Survival"))
 
     def __iter__(self) -> Iterator[Skill]:
-        for f in fields(self):
-            v = getattr(self, f.name)
-            if isinstance(v, Skill):
-                yield v
+        return (getattr(self, name) for name in _SKILL_FIELDS)
 
     def __getitem__(self, key: str) -> Skill:
         # First try field name lookup (e.g., "martial_arts")
@@ -474,6 +476,9 @@ class Skills:
         raise KeyError
 
 
+_SKILL_FIELDS = tuple(f.name for f in fields(Skills))
+
+
 @component(slots=True, kw_only=True)
 class AwardCap:
     learners: dict[int, dict[str, tuple[float, float]]] = field(default_factory=dict)
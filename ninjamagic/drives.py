@@ -7,6 +7,7 @@ Movement emerges from combined layer costs.
 import heapq
 import logging
 from array import array
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Literal
@@ -139,6 +140,7 @@ _seen: set[EntityId] = set()
 _pq: list[tuple[float, EntityId]] = []
 
 TILE_SIZE = TILE_STRIDE_H * TILE_STRIDE_W
+COMPASS_OFFSETS = tuple((direction, *direction.to_vector()) for direction in Compass)
 
 # Layer cache: (map_id, layer_name) -> (goals_key, base_layer, flee_layer, timestamp)
 # Forward reference to LayerName since it's defined after DijkstraMap
@@ -191,8 +193,10 @@ class DijkstraMap:
 
         chips = esper.component_for_entity(map_id, Chips)
 
-        pq: list[tuple[float, int, int]] = []
-        visited: dict[int, float] = {}
+        # Every step costs 1, so cells join the frontier in cost order. Merging it
+        # with the sorted seeds pops cells in the same order a heap would.
+        frontier: deque[tuple[float, int, int]] = deque()
+        visited: dict[tuple[int, int], float] = {}
 
         # Local constants to avoid repeated attribute lookups
         max_cost = self.max_cost
@@ -202,22 +206,25 @@ class DijkstraMap:
         stride_h = TILE_STRIDE_H
         stride_w = TILE_STRIDE_W
         tile_size = TILE_SIZE
-        heappush = heapq.heappush
-        heappop = heapq.heappop
+        push = frontier.append
 
+        starts: list[tuple[float, int, int]] = []
         for (y, x), cost in seeds.items():
             tile_y = y // stride_h * stride_h
             tile_x = x // stride_w * stride_w
             chip = chips_get((tile_y, tile_x))
             cell = chip[(y - tile_y) * stride_w + (x - tile_x)]
             if cell == 1 or cell == 3:
-                heappush(pq, (cost, y, x))
-                visited[((y & 0xFFFFFFFF) << 32) | (x & 0xFFFFFFFF)] = cost
-
-        while pq:
-            cost, y, x = heappop(pq)
-            key = ((y & 0xFFFFFFFF) << 32) | (x & 0xFFFFFFFF)
-            if cost > visited_get(key, max_cost):
+                starts.append((cost, y, x))
+                visited[y, x] = cost
+        starts.sort(reverse=True)
+
+        while starts or frontier:
+            if starts and (not frontier or starts[-1][0] < frontier[0][0]):
+                cost, y, x = starts.pop()
+            else:
+                cost, y, x = frontier.popleft()
+            if cost > visited_get((y, x), max_cost):
                 continue
 
             # Inlined set_cost
@@ -230,8 +237,11 @@ class DijkstraMap:
                 tiles[tile_key] = tile
             tile[(y - tile_y) * stride_w + (x - tile_x)] = cost
 
+            new_cost = cost + 1.0
             for dy, dx in EIGHT_DIRS:
                 ny, nx = y + dy, x + dx
+                if new_cost >= visited_get((ny, nx), max_cost):
+                    continue  # already reached as cheaply
                 ntile_y = ny // stride_h * stride_h
                 ntile_x = nx // stride_w * stride_w
                 chip = chips_get((ntile_y, ntile_x))
@@ -240,11 +250,8 @@ class DijkstraMap:
                 cell = chip[(ny - ntile_y) * stride_w + (nx - ntile_x)]
                 if cell != 1 and cell != 3:  # not walkable
                     continue
-                new_cost = cost + 1.0
-                nkey = ((ny & 0xFFFFFFFF) << 32) | (nx & 0xFFFFFFFF)
-                if new_cost < visited_get(nkey, max_cost):
-                    visited[nkey] = new_cost
-                    heappush(pq, (new_cost, ny, nx))
+                visited[ny, nx] = new_cost
+                push((new_cost, ny, nx))
 
     def get_cost(self, y: int, x: int) -> float:
         tile_y = y // TILE_STRIDE_H * TILE_STRIDE_H
@@ -436,8 +443,7 @@ def process() -> None:
             best_score = current_score
             best_direction: Compass | None = None
 
-            for direction in Compass:
-                dy, dx = direction.to_vector()
+            for direction, dy, dx in COMPASS_OFFSETS:
                 ny, nx = y + dy, x + dx
                 if not can_enter(map_id=map_id, y=ny, x=nx):
                     continue
@@ -28,13 +28,17 @@ def send_skills(entity: EntityId):
     )
 
 
+NEWBIE_RANKS = 50
+NEWBIE_LUT = tuple(
+    1.0 + (settings.newbie_exp_buff - 1.0) * util.ease_out_expo(1.0 - rank / NEWBIE_RANKS)
+    for rank in range(NEWBIE_RANKS)
+)
+
 
 def newbie_multiplier(rank: int) -> float:
-    if rank >= 50:
+    if rank >= NEWBIE_RANKS:
         return 1.0
-    t = util.clamp01(rank / 50.0)
-    progress = util.ease_out_expo(1.0 - t)
-    return 1.0 + (settings.newbie_exp_buff - 1.0) * progress
+    return NEWBIE_LUT[max(rank, 0)]
 
 
 def process():
@@ -62,13 +66,14 @@ def process():
                 if remaining:
                     mark_updated(learner_id, learner_skill)
 
+    get_award = Trial.get_award
     for sig in bus.iter(bus.Learn):
         skill = sig.skill
         award_cap = None
         if esper.entity_exists(sig.teacher):
             award_cap = esper.try_component(sig.teacher, AwardCap)
+        award = get_award(mult=sig.mult) * newbie_multiplier(skill.rank)
         if award_cap:
-            award = Trial.get_award(mult=sig.mult) * newbie_multiplier(skill.rank)
             if award:
                 now = util.get_looptime()
                 ledger = award_cap.learners.setdefault(sig.source, {})
@@ -85,7 +90,6 @@ def process():
                 ledger[skill.name] = (total, now)
                 award = granted
         else:
-            award = Trial.get_award(mult=sig.mult) * newbie_multiplier(skill.rank)
             skill.tnl += award
             skill.pending += award
             if award:
@@ -1,4 +1,5 @@
 import logging
+from copy import copy
 from typing import get_args
 
 import esper
@@ -91,9 +92,11 @@ def create_item(
     Required: transform, level (all items need position and level).
     Optional: contained_by (default 0), slot (default ANY).
     Overrides: replace template components.
+
+    Frozen template components are shared between items; mutable ones are copied.
     """
-    template = ITEM_TYPES[key]
-    entity = esper.create_entity(transform, slot, *template.values(), *overrides)
+    shared, mutable = ITEM_COMPONENTS[key]
+    entity = esper.create_entity(transform, slot, *shared, *map(copy, mutable), *overrides)
     esper.add_component(entity, level, Level)
     esper.add_component(entity, contained_by, ContainedBy)
     return entity
@@ -412,3 +415,12 @@ ITEM_TYPES: dict[str, dict[type, object]] = {
         DoNotSave: DoNotSave(),
     },
 }
+
+# Template components split once into (shared, copied-per-item) for create_item.
+ITEM_COMPONENTS: dict[str, tuple[tuple[object, ...], tuple[object, ...]]] = {
+    key: (
+        tuple(cmp for cmp in template.values() if cmp.__dataclass_params__.frozen),
+        tuple(cmp for cmp in template.values() if not cmp.__dataclass_params__.frozen),
+    )
+    for key, template in ITEM_TYPES.items()
+}
@@ -1,8 +1,7 @@
 import random
 
-EIGHT_DIRS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-BIRTH = {5, 6, 7}
-SURVIVE = {4, 5, 6, 7}
+from ninjamagic.world.life import life_step
+
 SIZE = (16, 16)
 LUT = [".", "#"]
 
@@ -10,20 +9,7 @@ LUT = [".", "#"]
 def game_of_life(grid: memoryview) -> memoryview:
     if not grid.shape:
         raise ValueError
-    h, w = grid.shape
-
-    def is_alive(y: int, x: int) -> bool:
-        if 0 <= y < h and 0 <= x < w:
-            return grid[y, x] == 1
-        return True
-
-    new = memoryview(bytearray(h * w)).cast("B", (h, w))
-    pts = [(y, x) for y in range(h) for x in range(w)]
-    for y, x in pts:
-        alive = is_alive(y, x)
-        pop = sum(is_alive(y + dy, x + dx) for dy, dx in EIGHT_DIRS)
-        if alive and pop in SURVIVE or not alive and pop in BIRTH:
-            new[y, x] = 1
+    new = life_step(grid)
 
     for y in range(SIZE[0]):
         for x in (0, SIZE[1] - 1):
@@ -1,25 +1,13 @@
-from ninjamagic.util import EIGHT_DIRS, RNG, TILE_STRIDE_H, TILE_STRIDE_W
+from ninjamagic.util import RNG, TILE_STRIDE_H, TILE_STRIDE_W
+from ninjamagic.world.life import life_step
 
 DEN_SIZE = 8
-BIRTH = {5, 6, 7}
-SURVIVE = {4, 5, 6, 7}
+DEN_LUT = (1, 2)  # 0 (walkable) -> 1 (floor), 1 (wall) -> 2 (wall)
 
 
 def _game_of_life(grid: memoryview) -> memoryview:
     h, w = grid.shape
-
-    def is_alive(y: int, x: int) -> bool:
-        if 0 <= y < h and 0 <= x < w:
-            return grid[y, x] == 1
-        return True
-
-    new = memoryview(bytearray(h * w)).cast("B", (h, w))
-    for y in range(h):
-        for x in range(w):
-            alive = is_alive(y, x)
-            pop = sum(is_alive(y + dy, x + dx) for dy, dx in EIGHT_DIRS)
-            if alive and pop in SURVIVE or not alive and pop in BIRTH:
-                new[y, x] = 1
+    new = life_step(grid)
 
     # Enforce walls at border
     for y in range(h):
@@ -48,7 +36,7 @@ def generate_den_prefab() -> bytearray:
 
 
 def stamp_den_prefab(
-    tile: bytearray, prefab: bytearray, lut: list[int]
+    tile: bytearray, prefab: bytearray, lut: tuple[int, int] = DEN_LUT
 ) -> tuple[int, int]:
     """Stamp an 8x8 prefab onto a 16x16 tile at a random offset, using LUT.
 
@@ -59,13 +47,14 @@ def stamp_den_prefab(
     offset_y = RNG.randint(0, max_offset)
     offset_x = RNG.randint(0, max_offset)
 
-    tile_view = memoryview(tile).cast("B", (TILE_STRIDE_H, TILE_STRIDE_W))
-    prefab_view = memoryview(prefab).cast("B", (DEN_SIZE, DEN_SIZE))
-
+    floor = lut[0]
     for dy in range(DEN_SIZE):
-        for dx in range(DEN_SIZE):
-            if prefab_view[dy, dx] == 0:  # Only copy walkable cells
-                tile_view[offset_y + dy, offset_x + dx] = lut[0]
+        row = prefab[dy * DEN_SIZE : (dy + 1) * DEN_SIZE]
+        start = (offset_y + dy) * TILE_STRIDE_W + offset_x
+        dx = row.find(0)  # Only copy walkable cells
+        while dx != -1:
+            tile[start + dx] = floor
+            dx = row.find(0, dx + 1)
 
     return offset_y, offset_x
 
@@ -78,13 +67,14 @@ def find_open_spots(
     n: int = 0,
 ) -> list[tuple[int, int]]:
     """Find walkable cells in the 8x8 den region. Returns world coordinates."""
-    tile_view = memoryview(tile).cast("B", (TILE_STRIDE_H, TILE_STRIDE_W))
-    spots = [
-        (offset_y + dy, offset_x + dx)
-        for dy in range(DEN_SIZE)
-        for dx in range(DEN_SIZE)
-        if tile_view[offset_y + dy, offset_x + dx] == walkable_id
-    ]
+    spots = []
+    for y in range(offset_y, offset_y + DEN_SIZE):
+        start = y * TILE_STRIDE_W + offset_x
+        row = tile[start : start + DEN_SIZE]
+        dx = row.find(walkable_id)
+        while dx != -1:
+            spots.append((y, offset_x + dx))
+            dx = row.find(walkable_id, dx + 1)
     if n > 0 and len(spots) > n:
         return RNG.sample(spots, n)
     return spots
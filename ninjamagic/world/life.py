@@ -0,0 +1,29 @@
+BIRTH = {5, 6, 7}
+SURVIVE = {4, 5, 6, 7}
+# Next state indexed by [alive][neighbour count].
+LIFE_RULE = (
+    bytes(n in BIRTH for n in range(9)),
+    bytes(n in SURVIVE for n in range(9)),
+)
+
+
+def life_step(grid: memoryview) -> memoryview:
+    """One cave automaton generation over a (h, w) grid of 0 (open) / 1 (wall)."""
+    h, w = grid.shape
+    cells = grid.tobytes()
+
+    # Pad with a ring of walls: cells past the edge count as alive.
+    wall = [1] * (w + 2)
+    rows = [wall, *([1, *cells[y * w : (y + 1) * w], 1] for y in range(h)), wall]
+    # 3-wide row sums; stacking three of them gives each cell's 3x3 box sum.
+    across = [[a + b + c for a, b, c in zip(r, r[1:], r[2:], strict=False)] for r in rows]
+
+    new = memoryview(bytearray(h * w)).cast("B", (h, w))
+    for y in range(h):
+        row = rows[y + 1]
+        boxes = map(sum, zip(across[y], across[y + 1], across[y + 2], strict=True))
+        for x, box in enumerate(boxes):
+            alive = row[x + 1]
+            new[y, x] = LIFE_RULE[alive][box - alive]
+
+    return new
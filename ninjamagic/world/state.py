@@ -73,7 +73,6 @@ def place_dens(map_id: EntityId, chips: Chips) -> None:
     - Decoration props (bones, skull, totem)
     - SpawnSlots for dormant mob spawning when players approach
     """
-    lut = [1, 2]  # 0 (walkable) -> 1 (floor), 1 (wall) -> 2 (wall)
     prop_defs = [
         ("bones", "⸸", 0.08, 0.15, 0.75),
         ("skull", "☠", 0.08, 0.10, 0.85),
@@ -86,7 +85,7 @@ def place_dens(map_id: EntityId, chips: Chips) -> None:
 
         # Generate and stamp cave terrain
         prefab = generate_den_prefab()
-        offset_y, offset_x = stamp_den_prefab(tile, prefab, lut)
+        offset_y, offset_x = stamp_den_prefab(tile, prefab)
 
         # Find open spots for placing objects
         spots = find_open_spots(tile, offset_y, offset_x, walkable_id=1, n=5)
@@ -132,10 +131,10 @@ def build_nowhere() -> EntityId:
     out = esper.create_entity()
     h, w = TILE_STRIDE
     chips = {
-        (0, 0): bytearray([1] * h * w),
-        (h, 0): bytearray([1] * h * w),
-        (0, w): bytearray([1] * h * w),
-        (h, w): bytearray([1] * h * w),
+        (0, 0): bytearray(b"\x01" * h * w),
+        (h, 0): bytearray(b"\x01" * h * w),
+        (0, w): bytearray(b"\x01" * h * w),
+        (h, w): bytearray(b"\x01" * h * w),
     }
 
     esper.add_component(out, chips, Chips)
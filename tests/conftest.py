@@ -1,6 +1,8 @@
 import asyncio
+import importlib
 import json
 import pathlib
+import re
 import warnings
 from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
@@ -23,9 +25,12 @@ from ninjamagic.component import Glyph, Health, Noun, Skills, Stance, Stats, Tra
 from ninjamagic.db import engine
 from ninjamagic.gen.messages_pb2 import Packet
 from ninjamagic.gen.query import AsyncQuerier
+from ninjamagic.util import RNG
 
 BASE_HTTP_URL = "http://localhost:8000"
 BASE_WS_URL = "ws://localhost:8000"
+# Golden fields that change between runs and are left out of the comparison.
+GOLDEN_VOLATILE_PATHS = re.compile(r"root.*?\['(id|seconds)'\]")
 
 
 # TODO Just use the sqlc generated fake models. UpdateCharacterParams or whatever.
@@ -68,8 +73,6 @@ def pytest_configure(config):
 
 @pytest.fixture(autouse=True)
 def make_tests_deterministic():
-    from ninjamagic.util import RNG
-
     state = RNG.getstate()
     yield
     RNG.setstate(state)
@@ -156,7 +159,7 @@ def golden_ws(
             if abs(actual_bytes - expected_bytes) <= tolerance:
                 rendered["len"] = expected["len"]  # normalize to avoid diff
 
-        diff = DeepDiff(rendered, expected, exclude_regex_paths=[r"root.*?\['(id|seconds)'\]"])
+        diff = DeepDiff(rendered, expected, exclude_regex_paths=GOLDEN_VOLATILE_PATHS)
         if diff:
             # Structural changes (keys added/removed) are failures
             structural_keys = {
@@ -244,8 +247,6 @@ async def client_factory() -> ClientFactory:
 
 @pytest_asyncio.fixture(autouse=True)
 async def db_rollback():
-    import importlib
-
     async with engine.connect() as conn:
         tx = await conn.begin()
 
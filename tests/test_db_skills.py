@@ -1,4 +1,12 @@
+import inspect
+from pathlib import Path
+from types import SimpleNamespace
+
+import esper
+
 import ninjamagic.gen.query as query
+from ninjamagic.component import Skills
+from ninjamagic.factory import load
 
 
 def test_skills_queries_exist():
@@ -10,33 +18,20 @@ def test_upsert_skills_query_exists():
 
 
 def test_upsert_skills_handles_pending():
-    import inspect
-
     src = inspect.getsource(query.AsyncQuerier.upsert_skills)
     assert "pending" in src
 
 
 def test_skills_migration_exists():
-    from pathlib import Path
-
     assert Path("migrations/003_skills.sql").exists()
 
 
 def test_skills_migration_backfills_skills_table():
-    from pathlib import Path
-
     sql = Path("migrations/003_skills.sql").read_text()
     assert "INSERT INTO" in sql and "skills" in sql
 
 
 def test_factory_load_uses_skills_table():
-    from types import SimpleNamespace
-
-    import esper
-
-    from ninjamagic.component import Skills
-    from ninjamagic.factory import load
-
     row = SimpleNamespace(
         owner_id=1,
         id=2,
@@ -68,15 +63,12 @@ def test_factory_load_uses_skills_table():
         SimpleNamespace(name="Survival", rank=1, tnl=0.05),
     ]
 
-    try:
-        entity = esper.create_entity()
-        load(entity, row, skill_rows)
-        skills = esper.component_for_entity(entity, Skills)
-        assert skills.martial_arts.rank == 4
-        assert skills.martial_arts.tnl == 0.25
-        assert skills.evasion.rank == 2
-        assert skills.evasion.tnl == 0.1
-        assert skills.survival.rank == 1
-        assert skills.survival.tnl == 0.05
-    finally:
-        esper.clear_database()
+    entity = esper.create_entity()
+    load(entity, row, skill_rows)
+    skills = esper.component_for_entity(entity, Skills)
+    assert skills.martial_arts.rank == 4
+    assert skills.martial_arts.tnl == 0.25
+    assert skills.evasion.rank == 2
+    assert skills.evasion.tnl == 0.1
+    assert skills.survival.rank == 1
+    assert skills.survival.tnl == 0.05
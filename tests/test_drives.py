@@ -6,19 +6,31 @@ from ninjamagic.util import TILE_STRIDE_H, TILE_STRIDE_W
 
 
 def test_dijkstra_negative_x_keys_are_distinct() -> None:
-    try:
-        map_id = esper.create_entity()
-        tile = bytearray([1] * (TILE_STRIDE_H * TILE_STRIDE_W))
-        chips = {
-            (0, 0): bytearray(tile),
-            (0, -TILE_STRIDE_W): bytearray(tile),
-        }
-        esper.add_component(map_id, chips, Chips)
-
-        layer = DijkstraMap()
-        layer.scan(goals=[(0, 0)], map_id=map_id)
-
-        assert layer.get_cost(0, -1) == 1.0
-        assert layer.get_cost(2, -1) == 2.0
-    finally:
-        esper.clear_database()
+    map_id = esper.create_entity()
+    tile = bytearray(b"\x01" * (TILE_STRIDE_H * TILE_STRIDE_W))
+    chips = {
+        (0, 0): bytearray(tile),
+        (0, -TILE_STRIDE_W): bytearray(tile),
+    }
+    esper.add_component(map_id, chips, Chips)
+
+    layer = DijkstraMap()
+    layer.scan(goals=[(0, 0)], map_id=map_id)
+
+    assert layer.get_cost(0, -1) == 1.0
+    assert layer.get_cost(2, -1) == 2.0
+
+
+def test_dijkstra_costs_are_steps_to_nearest_goal() -> None:
+    map_id = esper.create_entity()
+    tile = bytearray(b"\x01" * (TILE_STRIDE_H * TILE_STRIDE_W))
+    esper.add_component(map_id, {(0, 0): tile}, Chips)
+    goals = [(2, 2), (12, 9)]
+
+    layer = DijkstraMap()
+    layer.scan(goals=goals, map_id=map_id)
+
+    for y in range(TILE_STRIDE_H):
+        for x in range(TILE_STRIDE_W):
+            steps = min(max(abs(y - gy), abs(x - gx)) for gy, gx in goals)
+            assert layer.get_cost(y, x) == min(steps, layer.max_cost)
@@ -2,161 +2,116 @@ import esper
 import pytest
 
 import ninjamagic.bus as bus
+import ninjamagic.component as component
 import ninjamagic.experience as experience
 from ninjamagic.component import Skill, Skills
+from ninjamagic.config import settings
 
 
 def test_learn_adds_pending(monkeypatch):
-    try:
-        source = esper.create_entity()
-        skill = Skill(name="Martial Arts", rank=50)
+    source = esper.create_entity()
+    skill = Skill(name="Martial Arts", rank=50)
 
-        monkeypatch.setattr(experience.Trial, "get_award", lambda mult: 0.25)
+    monkeypatch.setattr(experience.Trial, "get_award", lambda mult: 0.25)
 
-        bus.pulse(bus.Learn(source=source, teacher=2, skill=skill, mult=1.0))
-        experience.process()
+    bus.pulse(bus.Learn(source=source, teacher=2, skill=skill, mult=1.0))
+    experience.process()
 
-        assert skill.tnl == 0.25
-        assert skill.pending == 0.25
-    finally:
-        esper.clear_database()
-        bus.clear()
+    assert skill.tnl == 0.25
+    assert skill.pending == 0.25
 
 
 def test_absorb_rest_exp_consolidates_pending():
-    try:
-        source = esper.create_entity()
-        skills = Skills(
-            martial_arts=Skill(name="Martial Arts", tnl=0.1, pending=0.5, rest_bonus=1.8)
-        )
-
-        bus.pulse(bus.AbsorbRestExp(source=source))
-
-        esper.add_component(source, skills)
-        experience.process()
-
-        assert skills.martial_arts.rank == 1
-        assert skills.martial_arts.tnl == pytest.approx(0.0)
-        assert skills.martial_arts.pending == 0.0
-        assert skills.martial_arts.rest_bonus == 1.0
-        outbound = [sig for sig in bus.iter(bus.OutboundSkill) if sig.to == source]
-        assert outbound
-        last = outbound[-1]
-        assert last.name == "Martial Arts"
-        assert last.rank == 1
-        assert last.tnl == pytest.approx(0.0)
-        assert last.pending == 0.0
-    finally:
-        esper.clear_database()
-        bus.clear()
+    source = esper.create_entity()
+    skills = Skills(martial_arts=Skill(name="Martial Arts", tnl=0.1, pending=0.5, rest_bonus=1.8))
+
+    bus.pulse(bus.AbsorbRestExp(source=source))
+
+    esper.add_component(source, skills)
+    experience.process()
+
+    assert skills.martial_arts.rank == 1
+    assert skills.martial_arts.tnl == pytest.approx(0.0)
+    assert skills.martial_arts.pending == 0.0
+    assert skills.martial_arts.rest_bonus == 1.0
+    outbound = [sig for sig in bus.iter(bus.OutboundSkill) if sig.to == source]
+    assert outbound
+    last = outbound[-1]
+    assert last.name == "Martial Arts"
+    assert last.rank == 1
+    assert last.tnl == pytest.approx(0.0)
+    assert last.pending == 0.0
 
 
 def test_absorb_rest_exp_applies_idle_bonus():
-    try:
-        source = esper.create_entity()
-        skills = Skills(
-            martial_arts=Skill(name="Martial Arts", tnl=0.1, pending=0.0, rest_bonus=1.0)
-        )
+    source = esper.create_entity()
+    skills = Skills(martial_arts=Skill(name="Martial Arts", tnl=0.1, pending=0.0, rest_bonus=1.0))
 
-        bus.pulse(bus.AbsorbRestExp(source=source))
+    bus.pulse(bus.AbsorbRestExp(source=source))
 
-        esper.add_component(source, skills)
-        experience.process()
+    esper.add_component(source, skills)
+    experience.process()
 
-        assert skills.martial_arts.rest_bonus == 1.8
-        assert skills.martial_arts.pending == 0.0
-    finally:
-        esper.clear_database()
-        bus.clear()
+    assert skills.martial_arts.rest_bonus == pytest.approx(1.8)
+    assert skills.martial_arts.pending == 0.0
 
 
 def test_absorb_rest_exp_emits_outbound_skill():
-    try:
-        source = esper.create_entity()
-        esper.add_component(
-            source,
-            Skills(martial_arts=Skill(name="Martial Arts", pending=0.2)),
-        )
-
-        bus.pulse(bus.AbsorbRestExp(source=source))
-        experience.process()
+    source = esper.create_entity()
+    esper.add_component(
+        source,
+        Skills(martial_arts=Skill(name="Martial Arts", pending=0.2)),
+    )
 
-        assert any(sig.to == source for sig in bus.iter(bus.OutboundSkill))
-    finally:
-        esper.clear_database()
-        bus.clear()
+    bus.pulse(bus.AbsorbRestExp(source=source))
+    experience.process()
 
+    assert any(sig.to == source for sig in bus.iter(bus.OutboundSkill))
 
 
 def test_rest_bonus_caps_at_ten():
-    try:
-        source = esper.create_entity()
-        skills = Skills(
-            martial_arts=Skill(name="Martial Arts", pending=0.0, rest_bonus=9.6)
-        )
+    source = esper.create_entity()
+    skills = Skills(martial_arts=Skill(name="Martial Arts", pending=0.0, rest_bonus=9.6))
 
-        bus.pulse(bus.AbsorbRestExp(source=source))
+    bus.pulse(bus.AbsorbRestExp(source=source))
 
-        esper.add_component(source, skills)
-        experience.process()
+    esper.add_component(source, skills)
+    experience.process()
 
-        assert skills.martial_arts.rest_bonus == 10.0
-    finally:
-        esper.clear_database()
-        bus.clear()
+    assert skills.martial_arts.rest_bonus == 10.0
 
 
 def test_restexp_removed():
-    import ninjamagic.component as component
-
     assert not hasattr(component, "RestExp")
 
 
 def test_newbie_bonus_falls_to_one():
-    from ninjamagic.config import settings
-
-    assert experience.newbie_multiplier(0) == pytest.approx(
-        settings.newbie_exp_buff, rel=1e-3
-    )
+    assert experience.newbie_multiplier(0) == pytest.approx(settings.newbie_exp_buff, rel=1e-3)
     assert experience.newbie_multiplier(50) == 1.0
 
 
 def test_rest_absorbs_pending_from_other_skills():
-    try:
-        source = esper.create_entity()
-        skills = Skills(
-            martial_arts=Skill(
-                name="Martial Arts", tnl=0.0, pending=0.4, rest_bonus=2.0
-            ),
-            survival=Skill(name="Survival", tnl=0.0, pending=0.0, rest_bonus=1.0),
-        )
+    source = esper.create_entity()
+    skills = Skills(
+        martial_arts=Skill(name="Martial Arts", tnl=0.0, pending=0.4, rest_bonus=2.0),
+        survival=Skill(name="Survival", tnl=0.0, pending=0.0, rest_bonus=1.0),
+    )
 
-        esper.add_component(source, skills)
-        bus.pulse(bus.AbsorbRestExp(source=source))
-        experience.process()
+    esper.add_component(source, skills)
+    bus.pulse(bus.AbsorbRestExp(source=source))
+    experience.process()
 
-        assert skills.martial_arts.tnl == pytest.approx(0.8)
-    finally:
-        esper.clear_database()
-        bus.clear()
+    assert skills.martial_arts.tnl == pytest.approx(0.8)
 
 
 def test_rest_absorb_triggers_rankup():
-    try:
-        source = esper.create_entity()
-        skills = Skills(
-            martial_arts=Skill(
-                name="Martial Arts", tnl=0.9, pending=0.2, rest_bonus=1.0
-            ),
-        )
-        esper.add_component(source, skills)
-        bus.pulse(bus.AbsorbRestExp(source=source))
-        experience.process()
-
-        assert skills.martial_arts.rank == 1
-        assert skills.martial_arts.tnl == pytest.approx(
-            0.1 * experience.RANKUP_FALLOFF
-        )
-    finally:
-        esper.clear_database()
-        bus.clear()
+    source = esper.create_entity()
+    skills = Skills(
+        martial_arts=Skill(name="Martial Arts", tnl=0.9, pending=0.2, rest_bonus=1.0),
+    )
+    esper.add_component(source, skills)
+    bus.pulse(bus.AbsorbRestExp(source=source))
+    experience.process()
+
+    assert skills.martial_arts.rank == 1
+    assert skills.martial_arts.tnl == pytest.approx(0.1 * experience.RANKUP_FALLOFF)
@@ -19,23 +19,22 @@ def test_generate_den_prefab_contains_only_valid_values():
     """Prefab cells should only be 0 (walkable) or 1 (wall)."""
     prefab = generate_den_prefab()
 
-    for cell in prefab:
-        assert cell in (0, 1)
+    assert prefab.count(0) + prefab.count(1) == len(prefab)
 
 
 def test_generate_den_prefab_has_walkable_cells():
     """Den should have some walkable space."""
     prefab = generate_den_prefab()
 
-    walkable_count = sum(1 for cell in prefab if cell == 0)
+    walkable_count = prefab.count(0)
     assert walkable_count >= 8, "Den should have at least 8 walkable cells"
 
 
 def test_stamp_den_prefab_only_copies_walkable_cells():
     """Stamp should only copy walkable cells, preserving existing terrain."""
-    tile = bytearray([2] * 256)  # All walls initially
-    prefab = bytearray([0] * 32 + [1] * 32)  # Top half walkable, bottom half wall
-    lut = [1, 2]  # 0 -> 1 (floor), 1 -> 2 (wall)
+    tile = bytearray(b"\x02" * 256)  # All walls initially
+    prefab = bytearray(b"\x00" * 32 + b"\x01" * 32)  # Top half walkable, bottom half wall
+    lut = (1, 2)  # 0 -> 1 (floor), 1 -> 2 (wall)
 
     offset_y, offset_x = stamp_den_prefab(tile, prefab, lut)
 
@@ -44,21 +43,18 @@ def test_stamp_den_prefab_only_copies_walkable_cells():
     assert 0 <= offset_x <= TILE_STRIDE_W - DEN_SIZE
 
     # Verify: walkable cells stamped, wall cells left unchanged
-    tile_view = memoryview(tile).cast("B", (TILE_STRIDE_H, TILE_STRIDE_W))
-    prefab_view = memoryview(prefab).cast("B", (DEN_SIZE, DEN_SIZE))
+    expected = bytes.maketrans(b"\x00\x01", bytes([lut[0], 2]))
     for dy in range(DEN_SIZE):
-        for dx in range(DEN_SIZE):
-            if prefab_view[dy, dx] == 0:  # Walkable in prefab
-                assert tile_view[offset_y + dy, offset_x + dx] == lut[0]
-            else:  # Wall in prefab - tile unchanged
-                assert tile_view[offset_y + dy, offset_x + dx] == 2
+        start = (offset_y + dy) * TILE_STRIDE_W + offset_x
+        row = prefab[dy * DEN_SIZE : (dy + 1) * DEN_SIZE]
+        assert tile[start : start + DEN_SIZE] == row.translate(expected)
 
 
 def test_stamp_den_prefab_returns_valid_offset():
     """Stamp should return offset within valid bounds."""
-    tile = bytearray([1] * 256)
+    tile = bytearray(b"\x01" * 256)
     prefab = generate_den_prefab()
-    lut = [1, 2]
+    lut = (1, 2)
 
     for _ in range(20):
         offset_y, offset_x = stamp_den_prefab(tile.copy(), prefab, lut)
@@ -68,9 +64,9 @@ def test_stamp_den_prefab_returns_valid_offset():
 
 def test_find_open_spots_returns_walkable_cells():
     """Should return world coordinates of walkable cells in the stamped region."""
-    tile = bytearray([2] * 256)  # All walls
+    tile = bytearray(b"\x02" * 256)  # All walls
     # Create a simple pattern: walkable at (0,0), (1,1), (2,2) in prefab coords
-    prefab = bytearray([1] * 64)  # All walls
+    prefab = bytearray(b"\x01" * 64)  # All walls
     prefab[0] = 0  # (0,0) walkable
     prefab[9] = 0  # (1,1) walkable
     prefab[18] = 0  # (2,2) walkable
@@ -80,11 +76,11 @@ def test_find_open_spots_returns_walkable_cells():
 
     # Stamp at offset (2, 3)
     offset_y, offset_x = 2, 3
-    tile_view = memoryview(tile).cast("B", (TILE_STRIDE_H, TILE_STRIDE_W))
-    prefab_view = memoryview(prefab).cast("B", (DEN_SIZE, DEN_SIZE))
+    table = bytes.maketrans(b"\x00\x01", bytes(lut))
     for dy in range(DEN_SIZE):
-        for dx in range(DEN_SIZE):
-            tile_view[offset_y + dy, offset_x + dx] = lut[prefab_view[dy, dx]]
+        start = (offset_y + dy) * TILE_STRIDE_W + offset_x
+        row = prefab[dy * DEN_SIZE : (dy + 1) * DEN_SIZE]
+        tile[start : start + DEN_SIZE] = row.translate(table)
 
     spots = find_open_spots(tile, offset_y, offset_x, walkable_id)
 
@@ -95,7 +91,7 @@ def test_find_open_spots_returns_walkable_cells():
 
 def test_find_open_spots_returns_n_random_spots():
     """With n parameter, should return at most n random spots."""
-    tile = bytearray([1] * 256)  # All walkable
+    tile = bytearray(b"\x01" * 256)  # All walkable
     walkable_id = 1
 
     spots = find_open_spots(tile, 0, 0, walkable_id, n=5)
@@ -1,7 +1,6 @@
 from typing import get_args
 
 import esper
-import httpx
 import pytest
 
 import ninjamagic.bus as bus
@@ -18,7 +17,6 @@ from ninjamagic.inventory import (
     save_map_inventory,
     save_player_inventory,
 )
-from ninjamagic.main import app
 from ninjamagic.world import state as world_state
 
 
@@ -52,11 +50,7 @@ async def test_inventory_world_item_load_and_pickup():
                 levels=[0],
             )
         )
-    async with app.router.lifespan_context(app), httpx.AsyncClient(
-        transport=httpx.ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        await client.get("/")
+        await load_map_inventory(q)
 
     # Find the torch by its ItemKey and Transform
     item_entity = next(
@@ -86,49 +80,45 @@ async def test_nested_container_save_and_load():
     player = esper.create_entity()
     esper.add_component(player, OwnerId(char_id))
 
-    # Create items: backpack → cookpot → meal
-    backpack = create_item("backpack", transform=Transform(map_id=0, y=0, x=0), level=0)
-    cookpot = create_item("cookpot", transform=Transform(map_id=0, y=0, x=0), level=0)
-    meal = create_item("meal", transform=Transform(map_id=0, y=0, x=0), level=0)
-
-    # Set up containment hierarchy
-    esper.add_component(backpack, player, ContainedBy)
-    esper.add_component(backpack, Slot.BACK)
-    esper.add_component(cookpot, backpack, ContainedBy)
-    esper.add_component(cookpot, Slot.ANY)
-    esper.add_component(meal, cookpot, ContainedBy)
-    esper.add_component(meal, Slot.ANY)
+    # Create items in their containment hierarchy: backpack → cookpot → meal
+    backpack = create_item(
+        "backpack",
+        transform=Transform(map_id=0, y=0, x=0),
+        level=0,
+        contained_by=player,
+        slot=Slot.BACK,
+    )
+    cookpot = create_item(
+        "cookpot", transform=Transform(map_id=0, y=0, x=0), level=0, contained_by=backpack
+    )
+    meal = create_item(
+        "meal", transform=Transform(map_id=0, y=0, x=0), level=0, contained_by=cookpot
+    )
 
-    # Save to database
     async with db.get_repository_factory() as q:
+        # Save to database
         await save_player_inventory(q, owner_id=char_id, owner_entity=player)
 
-    # Clear all entities
-    esper.delete_entity(meal)
-    esper.delete_entity(cookpot)
-    esper.delete_entity(backpack)
-    esper.delete_entity(player)
-    esper.clear_dead_entities()
+        # Clear all entities
+        esper.delete_entity(meal)
+        esper.delete_entity(cookpot)
+        esper.delete_entity(backpack)
+        esper.delete_entity(player)
+        esper.clear_dead_entities()
 
-    # Create fresh player entity for loading
-    player2 = esper.create_entity()
-    assert player != player2
-    esper.add_component(player2, OwnerId(char_id))
+        # Create fresh player entity for loading
+        player2 = esper.create_entity()
+        assert player != player2
+        esper.add_component(player2, OwnerId(char_id))
 
-    # Load from database
-    async with db.get_repository_factory() as q:
+        # Load from database, reading the save back inside the same transaction
         await load_player_inventory(q, owner_id=char_id, entity_id=player2)
 
     # Find loaded items by their keys
-    loaded_backpack = next(
-        eid for eid, key in esper.get_component(ItemKey) if key.key == "backpack"
-    )
-    loaded_cookpot = next(
-        eid for eid, key in esper.get_component(ItemKey) if key.key == "cookpot"
-    )
-    loaded_meal = next(
-        eid for eid, key in esper.get_component(ItemKey) if key.key == "meal"
-    )
+    by_key = {key.key: eid for eid, key in esper.get_component(ItemKey)}
+    loaded_backpack = by_key["backpack"]
+    loaded_cookpot = by_key["cookpot"]
+    loaded_meal = by_key["meal"]
 
     # Verify containment hierarchy is restored
     assert esper.component_for_entity(loaded_backpack, ContainedBy) == player2
@@ -189,12 +179,9 @@ async def test_item_state_persistence():
         await load_player_inventory(q, owner_id=char_id, entity_id=player2)
 
     # Find loaded items
-    loaded_forage = next(
-        eid for eid, key in esper.get_component(ItemKey) if key.key == "forage"
-    )
-    loaded_meal = next(
-        eid for eid, key in esper.get_component(ItemKey) if key.key == "meal"
-    )
+    by_key = {key.key: eid for eid, key in esper.get_component(ItemKey)}
+    loaded_forage = by_key["forage"]
+    loaded_meal = by_key["meal"]
 
     # Assert Noun state persisted
     loaded_noun = esper.component_for_entity(loaded_forage, Noun)
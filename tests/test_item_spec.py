@@ -1,7 +1,9 @@
+from dataclasses import is_dataclass
+
 import esper
 
-from ninjamagic.component import Transform
-from ninjamagic.inventory import create_item, State
+from ninjamagic.component import Anchor, ItemKey, Transform
+from ninjamagic.inventory import ITEM_TYPES, State, create_item
 
 
 def test_serialize_state_returns_empty_json_when_unchanged():
@@ -11,3 +13,20 @@ def test_serialize_state_returns_empty_json_when_unchanged():
     # Serialize state - should be empty JSON object since nothing changed
     state = State.from_entity(eid).model_dump_json()
     assert state == "{}"
+
+
+def test_template_components_are_slotted_dataclasses():
+    for template in ITEM_TYPES.values():
+        for cmp in template.values():
+            assert is_dataclass(cmp), type(cmp)
+            assert type(cmp).__dataclass_params__.slots, type(cmp)
+
+
+def test_create_item_copies_mutable_template_components():
+    a = create_item("bonfire", transform=Transform(map_id=0, y=0, x=0), level=0)
+    b = create_item("bonfire", transform=Transform(map_id=0, y=0, x=0), level=0)
+
+    esper.component_for_entity(a, Anchor).rank += 1
+
+    assert esper.component_for_entity(b, Anchor) == ITEM_TYPES["bonfire"][Anchor]
+    assert esper.component_for_entity(a, ItemKey) is esper.component_for_entity(b, ItemKey)
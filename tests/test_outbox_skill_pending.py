@@ -17,15 +17,11 @@ def test_outbound_skill_includes_pending():
 
 
 def test_outbound_skill_has_pending_field():
-    try:
-        eid = esper.create_entity()
-        esper.add_component(
-            eid,
-            Skills(martial_arts=Skill(name="Martial Arts", rank=1, tnl=0.5, pending=0.25)),
-        )
-        experience.send_skills(eid)
-        sig = next(bus.iter(bus.OutboundSkill))
-        assert sig.pending == 0.25
-    finally:
-        esper.clear_database()
-        bus.clear()
+    eid = esper.create_entity()
+    esper.add_component(
+        eid,
+        Skills(martial_arts=Skill(name="Martial Arts", rank=1, tnl=0.5, pending=0.25)),
+    )
+    experience.send_skills(eid)
+    sig = next(bus.iter(bus.OutboundSkill))
+    assert sig.pending == 0.25
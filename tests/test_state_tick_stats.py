@@ -1,11 +1,22 @@
 import re
 
+import pytest
+
 from ninjamagic.util import TickStats
 
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
-
-
-def test_tick_stats_histogram_and_late_ticks():
+COLOR_RE = re.compile(r"\x1b\[(3[12])m")
+
+
+@pytest.mark.parametrize(
+    "durations, expected_counts, expected_late",
+    [
+        ((0.003, 0.010, 0.012, 0.020), [1, 0, 1, 2], 1),
+        ((0.003, 0.005, 0.017), [1, 1, 0, 1], 1),
+    ],
+    ids=["mixed", "sparse"],
+)
+def test_tick_stats_histogram_and_late_ticks(durations, expected_counts, expected_late):
     stats = TickStats(
         step=0.01,
         alpha=0.5,
@@ -13,24 +24,17 @@ def test_tick_stats_histogram_and_late_ticks():
         frame_budget_ms=8.0,
     )
 
-    stats.record(tick_duration=0.003, jitter=0.0)
-    stats.record(tick_duration=0.010, jitter=0.0)
-    stats.record(tick_duration=0.012, jitter=0.0)
-    stats.record(tick_duration=0.020, jitter=0.0)
+    for duration in durations:
+        stats.record(tick_duration=duration, jitter=0.0)
 
     snapshot = stats.snapshot_and_reset()
-    counts = snapshot.bucket_counts
 
-    assert snapshot.total_ticks == 4
-    assert snapshot.late_ticks == 1
-    assert counts[0] == 1
-    assert counts[2] == 1
-    assert counts[-1] == 2
-    assert sum(counts) == 4
+    assert snapshot.total_ticks == len(durations)
+    assert snapshot.late_ticks == expected_late
+    assert snapshot.bucket_counts == expected_counts
 
     rendered = str(snapshot)
-    assert "\x1b[32m" in rendered
-    assert "\x1b[31m" in rendered
+    assert set(COLOR_RE.findall(rendered)) == {"31", "32"}
     cleaned = ANSI_RE.sub("", rendered)
     assert "0-4ms" in cleaned
     assert "10ms+" in cleaned